@@ -1,39 +1,153 @@
 import os
+import re
+import sys
+import math
 import time
+import argparse
+import subprocess
+import shutil
+import tempfile
+import requests
+from pathlib import Path
+from urllib.parse import urljoin, unquote
+from selectolax.lexbor import LexborHTMLParser
 import undetected_chromedriver as uc
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 
 # Configuration
 HEADLESS_MODE = True  # Set to False to see browser window
 IBKR_METRICS_URL = "https://investors.interactivebrokers.com/en/general/about/monthly-metrics.php"  # Correct IBKR metrics page URL
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+MAX_DOWNLOAD_WORKERS = 8  # Upper bound on parallel PDF downloads
+CHROME_BINARIES = {
+    'linux': ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser'],
+    'darwin': ['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'],
+}
+
+# XPath selectors, each joined into a single union so one WebDriverWait covers every variant
+COOKIE_XPATH = " | ".join([
+    "//button[contains(text(), 'ACCEPT') or contains(text(), 'Accept') or contains(text(), 'accept')]",
+    "//button[contains(@class, 'cookie') and (contains(text(), 'OK') or contains(text(), 'Accept'))]",
+    "//a[contains(text(), 'Accept') or contains(text(), 'ACCEPT')]",
+    "//*[@id='cookie-accept']",
+    "//*[contains(@class, 'cookie-accept')]"
+])
+CLOSE_XPATH = " | ".join([
+    "//button[contains(@class, 'close')]",
+    "//button[contains(@aria-label, 'close')]",
+    "//*[contains(@class, 'modal-close')]",
+    "//*[contains(@class, 'popup-close')]"
+])
+# Section markers in priority order; the union is only used to wait for any of them
+SECTION_XPATHS = (
+    "//h3[contains(text(), 'Most Recent')]",
+    "//h4[contains(text(), 'Latest Press Release')]",
+    "//h4[contains(text(), 'Historical Brokerage Metrics')]",
+    "//a[contains(@href, 'latestMetric')]"
+)
+SECTION_XPATH = " | ".join(SECTION_XPATHS)
+SECTION_CONTAINER_XPATH = "./ancestor::div[contains(@class, 'container') or contains(@class, 'row') or contains(@class, 'col')]"
+DOWNLOAD_LINK_XPATH = "//a[contains(@href, 'getFileNew.php')]"
+
+# The same section markers as (CSS selector, required own text) for the static HTML path
+SECTION_MARKERS = (
+    ("h3", "Most Recent"),
+    ("h4", "Latest Press Release"),
+    ("h4", "Historical Brokerage Metrics"),
+    ("a[href*='latestMetric']", None)
+)
+SECTION_CONTAINER_CLASSES = ('container', 'row', 'col')
+
+# Collects every download link with its highlight-box heading in a single WebDriver round-trip
+PDF_LINKS_SCRIPT = """
+const root = arguments[0] || document;
+return Array.from(root.querySelectorAll("a[href*='getFileNew.php']")).map(a => {
+    const box = a.closest('.highlight-box');
+    const h4 = box ? box.querySelector('h4') : null;
+    return {href: a.href, desc: h4 ? h4.innerText.split('\\n')[0].trim() : ''};
+});
+"""
+
+# Hides the webdriver flag and chromedriver's cdc_ globals
+ANTI_DETECTION_SCRIPT = """
+Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+delete window.cdc_adoQpoasnfa76pfcZLmcfl_Array;
+delete window.cdc_adoQpoasnfa76pfcZLmcfl_Promise;
+delete window.cdc_adoQpoasnfa76pfcZLmcfl_Symbol;
+"""
 
 def get_chrome_version():
-    """Detect Chrome version"""
+    """Detect the installed Chrome major version without launching a browser"""
     try:
-        driver = uc.Chrome(version_main=None)  # Auto-detect version
-        version = driver.capabilities['browserVersion']
-        driver.quit()
-        return version
+        if sys.platform == 'win32':
+            import winreg
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Google\Chrome\BLBeacon") as key:
+                version, _ = winreg.QueryValueEx(key, "version")
+        else:
+            version = None
+            for binary in CHROME_BINARIES.get(sys.platform, CHROME_BINARIES['linux']):
+                try:
+                    version = subprocess.check_output([binary, '--version'], text=True, timeout=10)
+                    break
+                except (OSError, subprocess.SubprocessError):
+                    continue
+            if not version:
+                return None
+
+        match = re.search(r'(\d+)\.', version)
+        return int(match.group(1)) if match else None
     except Exception as e:
         print(f"Could not detect Chrome version: {e}")
         return None
 
-def find_and_download_pdfs(url):
-    """Navigate to IBKR website and find PDFs in Most Recent Information section"""
-    
-    # Create downloads directory if it doesn't exist
-    downloads_dir = "downloads"
-    if not os.path.exists(downloads_dir):
-        os.makedirs(downloads_dir)
+def _describe_link(href):
+    """Fallback description for a download link, derived from its URL"""
+    if 'latestMetricPR' in href:
+        return "Latest Press Release"
+    elif 'latestMetric' in href:
+        return "Historical Brokerage Metrics"
+    return "PDF Document"
+
+def _filename_from_response(response, fallback_name):
+    """Get the download filename from Content-Disposition"""
+    disposition = response.headers.get('Content-Disposition', '')
+    match = re.search(r"filename(\*?)=(?:UTF-8'')?\"?([^\";]+)\"?", disposition, re.IGNORECASE)
+    if match:
+        filename = match.group(2).strip()
+        if match.group(1):  # RFC 5987 filename* values are percent-encoded
+            filename = unquote(filename)
+        return os.path.basename(filename)
+    return fallback_name
+
+def _download(session, url, downloads_dir, fallback_name):
+    """Stream a single PDF into the downloads directory and return its path"""
+    with session.get(url, stream=True, timeout=30) as response:
+        response.raise_for_status()
+        file_path = os.path.join(downloads_dir, _filename_from_response(response, fallback_name))
+        response.raw.decode_content = True
+        # Download to a temp file first so a failed transfer never truncates an existing PDF
+        temp_file = tempfile.NamedTemporaryFile(dir=downloads_dir, suffix='.part', delete=False)
+        try:
+            with temp_file:
+                shutil.copyfileobj(response.raw, temp_file, length=1 << 20)
+            os.replace(temp_file.name, file_path)
+        except BaseException:
+            os.unlink(temp_file.name)
+            raise
+    return file_path
+
+def _create_driver(downloads_dir):
+    """Launch an undetected Chrome instance configured for scraping"""
     
     # Detect Chrome version
     print("Detecting Chrome version...")
     chrome_version = get_chrome_version()
     if chrome_version:
-        print(f"Chrome version detected: {chrome_version}")
+        print(f"Chrome major version detected: {chrome_version}")
     else:
         print("Using auto-detection for Chrome version")
     
@@ -57,7 +171,10 @@ def find_and_download_pdfs(url):
     options.add_argument("--disable-notifications")
     options.add_argument("--disable-infobars")
     options.add_argument("--disable-save-password-bubble")
-    options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    options.add_argument(f"--user-agent={USER_AGENT}")
+    
+    # Skip rendering assets the scraper never uses
+    options.add_argument("--blink-settings=imagesEnabled=false")
     
     # Set download directory and popup preferences
     prefs = {
@@ -68,225 +185,384 @@ def find_and_download_pdfs(url):
         "profile.default_content_settings.popups": 0,  # Allow popups
         "profile.default_content_setting_values.notifications": 2,  # Block notifications
         "profile.managed_default_content_settings.popups": 1,  # Allow popups
-        "profile.content_settings.exceptions.automatic_downloads.*.setting": 1  # Allow downloads
+        "profile.content_settings.exceptions.automatic_downloads.*.setting": 1,  # Allow downloads
+        "profile.managed_default_content_settings.images": 2,  # Block images
+        "profile.managed_default_content_settings.stylesheets": 2,  # Block stylesheets
+        "profile.managed_default_content_settings.fonts": 2  # Block web fonts
     }
     options.add_experimental_option("prefs", prefs)
     
-    driver = None
+    driver = uc.Chrome(options=options, version_main=chrome_version)  # None falls back to auto-detection
+    
+    # Additional anti-detection measures, applied in a single WebDriver round-trip
+    driver.execute_script(ANTI_DETECTION_SCRIPT)
+    
+    return driver
+
+def _first_clickable(xpath):
+    """Wait condition for the first visible, enabled XPath match"""
+    def condition(driver):
+        for element in driver.find_elements(By.XPATH, xpath):
+            try:
+                if element.is_displayed() and element.is_enabled():
+                    return element
+            except StaleElementReferenceException:
+                continue
+        return False
+    return condition
+
+def _find_section_static(tree):
+    """Find the Most Recent section in the static HTML"""
+    for selector, text in SECTION_MARKERS:
+        for element in tree.css(selector):
+            if text is not None and text not in element.text(deep=False):
+                continue
+            # Outermost matching ancestor div, as SECTION_CONTAINER_XPATH selects in the browser
+            container = None
+            node = element.parent
+            while node is not None:
+                classes = node.attributes.get('class') or ''
+                if node.tag == 'div' and any(name in classes for name in SECTION_CONTAINER_CLASSES):
+                    container = node
+                node = node.parent
+            if container is not None:
+                return container
+            break  # Only the first match of each selector is tried, as in the browser path
+    return None
+
+def _find_pdf_links_static(session, url):
+    """Read the PDF links from the static HTML"""
+    print(f"Fetching: {url}")
     try:
-        driver = uc.Chrome(options=options, version_main=None)  # Auto-detect Chrome version
-        
-        # Additional anti-detection measures
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        driver.execute_script("delete window.cdc_adoQpoasnfa76pfcZLmcfl_Array;")
-        driver.execute_script("delete window.cdc_adoQpoasnfa76pfcZLmcfl_Promise;")
-        driver.execute_script("delete window.cdc_adoQpoasnfa76pfcZLmcfl_Symbol;")
-        
-        print(f"Navigating to: {url}")
-        driver.get(url)
+        response = session.get(url, timeout=15)
+    except requests.RequestException as e:
+        print(f"Static fetch failed: {e}")
+        return None
+    
+    if response.status_code in (403, 503):
+        print(f"Static fetch blocked (HTTP {response.status_code})")
+        return None
+    if not response.ok:
+        print(f"Static fetch failed (HTTP {response.status_code})")
+        return None
+    
+    tree = LexborHTMLParser(response.text)
+    section = _find_section_static(tree)
+    if section is None:
+        print("Most Recent section not found in static HTML")
+        return None
+    
+    pdf_links = []
+    for anchor in section.css("a[href*='getFileNew.php']"):
+        href = anchor.attributes.get('href')
+        if not href:
+            continue
+        href = urljoin(response.url, href)
         
-        # Wait longer for page to load
-        time.sleep(5)
+        # Take the first line of the h4 heading in the enclosing highlight-box
+        description = ""
+        node = anchor.parent
+        while node is not None and 'highlight-box' not in (node.attributes.get('class') or '').split():
+            node = node.parent
+        h4 = node.css_first('h4') if node is not None else None
+        if h4 is not None:
+            description = h4.text(separator='\n', strip=True).split('\n')[0]
         
-        # Wait for page to load
+        pdf_links.append({
+            'url': href,
+            'description': description or _describe_link(href)
+        })
+    
+    if not pdf_links:
+        print("No download links in static HTML")
+        return None
+    
+    return pdf_links
+
+def _find_pdf_links_with_browser(driver, url):
+    """Read the PDF links from the page rendered in Chrome"""
+    print(f"Navigating to: {url}")
+    driver.get(url)
+    
+    # Wait for page to load
+    WebDriverWait(driver, 20).until(
+        EC.presence_of_element_located((By.TAG_NAME, "body"))
+    )
+    
+    # Wait until the download links have been rendered instead of sleeping blindly
+    try:
         WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
+            EC.presence_of_element_located((By.XPATH, DOWNLOAD_LINK_XPATH))
         )
-        
-        # Handle various popups and overlays
-        try:
-            # Handle cookie banner
-            cookie_buttons = [
-                "//button[contains(text(), 'ACCEPT') or contains(text(), 'Accept') or contains(text(), 'accept')]",
-                "//button[contains(@class, 'cookie') and (contains(text(), 'OK') or contains(text(), 'Accept'))]",
-                "//a[contains(text(), 'Accept') or contains(text(), 'ACCEPT')]",
-                "//*[@id='cookie-accept']",
-                "//*[@class*='cookie-accept']"
-            ]
-            
-            for selector in cookie_buttons:
-                try:
-                    cookie_btn = WebDriverWait(driver, 3).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                    driver.execute_script("arguments[0].click();", cookie_btn)
-                    print("Accepted cookies")
-                    time.sleep(2)
-                    break
-                except:
-                    continue
-        except:
-            print("No cookie banner found or already handled")
-        
-        # Handle any other popups/modals
+    except TimeoutException:
+        print("Download links not rendered yet, continuing with section search")
+    
+    # Handle various popups and overlays
+    try:
+        # Handle cookie banner
+        # Check every match: a hidden early match must not hide a visible consent button
+        cookie_btn = WebDriverWait(driver, 3).until(_first_clickable(COOKIE_XPATH))
+        driver.execute_script("arguments[0].click();", cookie_btn)
+        print("Accepted cookies")
         try:
-            close_buttons = [
-                "//button[contains(@class, 'close')]",
-                "//button[contains(@aria-label, 'close')]",
-                "//*[@class*='modal-close']",
-                "//*[@class*='popup-close']"
-            ]
-            
-            for selector in close_buttons:
-                try:
-                    close_btn = driver.find_element(By.XPATH, selector)
-                    if close_btn.is_displayed():
-                        driver.execute_script("arguments[0].click();", close_btn)
-                        print("Closed popup/modal")
-                        time.sleep(1)
-                except:
-                    continue
-        except:
+            WebDriverWait(driver, 5).until(EC.invisibility_of_element(cookie_btn))
+        except TimeoutException:
             pass
-        
-        # Scroll to make sure content is loaded
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
-        driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(2)
-        
-        print("Page loaded. Searching for PDF download links...")
-        
-        # Find the "Most Recent Information" section
-        most_recent_section = None
+    except:
+        print("No cookie banner found or already handled")
+    
+    # Handle any other popups/modals
+    try:
+        for close_btn in driver.find_elements(By.XPATH, CLOSE_XPATH):
+            try:
+                if close_btn.is_displayed() and close_btn.is_enabled():
+                    driver.execute_script("arguments[0].click();", close_btn)
+                    print("Closed popup/modal")
+                    WebDriverWait(driver, 3).until(EC.invisibility_of_element(close_btn))
+            except:
+                continue
+    except:
+        pass
+    
+    # Scroll to make sure content is loaded
+    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+    try:
+        WebDriverWait(driver, 10).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+    except TimeoutException:
+        print("Page still loading, continuing with what is available")
+    driver.execute_script("window.scrollTo(0, 0);")
+    
+    print("Page loaded. Searching for PDF download links...")
+    
+    # Find the "Most Recent Information" section
+    most_recent_section = None
+    try:
+        # Wait once for any known section marker, then try the markers in priority order
         try:
-            # Try multiple variations of finding the section
-            selectors = [
-                "//h3[contains(text(), 'Most Recent Information')]",
-                "//h3[contains(text(), 'Most Recent')]",
-                "//h4[contains(text(), 'Latest Press Release')]",
-                "//h4[contains(text(), 'Historical Brokerage Metrics')]",
-                "//a[contains(@href, 'latestMetricPR')]",
-                "//a[contains(@href, 'latestMetric')]"
-            ]
-            
-            for selector in selectors:
-                try:
-                    element = WebDriverWait(driver, 5).until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    print(f"Found element with selector: {selector}")
-                    # Get the parent container that contains the PDFs
-                    most_recent_section = element.find_element(By.XPATH, "./ancestor::div[contains(@class, 'container') or contains(@class, 'row') or contains(@class, 'col')]")
-                    break
-                except:
-                    continue
-            
-            if not most_recent_section:
-                # Last resort: look for any links with the specific PDF URLs
-                print("Trying direct link search...")
-                download_links = driver.find_elements(By.XPATH, "//a[contains(@href, 'getFileNew.php')]")
-                if download_links:
-                    print(f"Found {len(download_links)} direct download links")
-                    most_recent_section = driver  # Use the whole page
-            
+            WebDriverWait(driver, 5).until(
+                EC.presence_of_element_located((By.XPATH, SECTION_XPATH))
+            )
         except TimeoutException:
-            print("Could not find any recognizable elements")
+            pass
         
-        # Find all PDF download links in this section
-        pdf_links = []
-        try:
-            # Look for links that contain 'getFileNew.php'
-            download_links = most_recent_section.find_elements(By.XPATH, ".//a[contains(@href, 'getFileNew.php')]")
-            
-            for link in download_links:
-                href = link.get_attribute('href')
-                if href:
-                    # Try to find the description from nearby h4 element
-                    try:
-                        # Look for h4 element in the same highlight-box
-                        highlight_box = link.find_element(By.XPATH, "./ancestor::div[contains(@class, 'highlight-box')]")
-                        h4_element = highlight_box.find_element(By.TAG_NAME, "h4")
-                        description = h4_element.text.split('\n')[0].strip()  # Get first line, remove date
-                    except:
-                        # Fallback: determine description from URL
-                        if 'latestMetricPR' in href:
-                            description = "Latest Press Release"
-                        elif 'latestMetric' in href:
-                            description = "Historical Brokerage Metrics"
-                        else:
-                            description = "PDF Document"
-                    
-                    pdf_links.append({
-                        'url': href,
-                        'description': description,
-                        'element': link
-                    })
-            
-        except Exception as e:
-            print(f"Error finding PDF links: {e}")
+        for selector in SECTION_XPATHS:
+            try:
+                element = driver.find_element(By.XPATH, selector)
+                # Get the parent container that contains the PDFs
+                most_recent_section = element.find_element(By.XPATH, SECTION_CONTAINER_XPATH)
+                print(f"Found element with selector: {selector}")
+                break
+            except:
+                continue
         
-        if not pdf_links:
-            print("No PDF download links found in the 'Most Recent Information' section")
-            return []
+        if not most_recent_section:
+            # Last resort: look for any links with the specific PDF URLs
+            print("Trying direct link search...")
+            download_links = driver.find_elements(By.XPATH, DOWNLOAD_LINK_XPATH)
+            if download_links:
+                print(f"Found {len(download_links)} direct download links")
+                most_recent_section = driver  # Use the whole page
         
-        print(f"Found {len(pdf_links)} PDF links:")
-        for link in pdf_links:
-            print(f"  - {link['description']}: {link['url']}")
+    except TimeoutException:
+        print("Could not find any recognizable elements")
+    
+    # Find all PDF download links in this section
+    pdf_links = []
+    try:
+        # Read hrefs and descriptions for all links in one script call
+        section_root = most_recent_section if most_recent_section is not driver else None
+        for result in driver.execute_script(PDF_LINKS_SCRIPT, section_root):
+            href = result.get('href')
+            if href:
+                pdf_links.append({
+                    'url': href,
+                    'description': result.get('desc') or _describe_link(href)
+                })
         
-        # Download each PDF
-        downloaded_files = []
-        for i, pdf_link in enumerate(pdf_links):
+    except Exception as e:
+        print(f"Error finding PDF links: {e}")
+    
+    return pdf_links
+
+def _download_pdfs(session, pdf_links, downloads_dir):
+    """Download the PDFs in parallel"""
+    downloaded_files = []
+    print(f"\nDownloading {len(pdf_links)} files in parallel...")
+    with ThreadPoolExecutor(max_workers=min(len(pdf_links), MAX_DOWNLOAD_WORKERS)) as executor:
+        futures = {
+            executor.submit(_download, session, pdf_link['url'], downloads_dir,
+                            f"{pdf_link['description'].replace(' ', '_')}_{i+1}.pdf"): pdf_link
+            for i, pdf_link in enumerate(pdf_links)
+        }
+        for future in as_completed(futures):
+            pdf_link = futures[future]
             try:
-                print(f"\nDownloading file {i+1}/{len(pdf_links)}: {pdf_link['description']}")
-                
-                # Click the download link or navigate to URL
-                if pdf_link['element']:
-                    driver.execute_script("arguments[0].click();", pdf_link['element'])
-                else:
-                    driver.get(pdf_link['url'])
-                
-                print(f"Download initiated for: {pdf_link['description']}")
-                time.sleep(5)  # Wait for download to start
-                
+                file_path = future.result()
+                print(f"Downloaded {pdf_link['description']}: {os.path.basename(file_path)}")
                 downloaded_files.append(pdf_link['description'])
-                
             except Exception as e:
                 print(f"Error downloading {pdf_link['description']}: {e}")
+    return downloaded_files
+
+class IBKRScraper:
+    """Scraper that keeps its session and browser between fetches"""
+    
+    def __init__(self, url=IBKR_METRICS_URL, downloads_dir="downloads"):
+        self.url = url
+        self.downloads_dir = downloads_dir
+        self.session = None
+        self.driver = None
+    
+    def __enter__(self):
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def start(self):
+        """Create the downloads directory and the shared HTTP session"""
+        # Create downloads directory if it doesn't exist
+        if not os.path.exists(self.downloads_dir):
+            os.makedirs(self.downloads_dir)
         
-        # Wait for all downloads to complete
-        print("\nWaiting for downloads to complete...")
-        time.sleep(15)
+        if self.session is None:
+            self.session = requests.Session()
+            self.session.headers['User-Agent'] = USER_AGENT
+    
+    def close(self):
+        """Close the HTTP session and quit Chrome if it was started"""
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+        self._quit_driver()
+    
+    def _quit_driver(self):
+        if self.driver:
+            try:
+                self.driver.quit()
+            except:
+                pass  # Ignore cleanup errors
+            self.driver = None
+    
+    def _find_pdf_links(self):
+        # The links are normally present in the server-rendered HTML; only use Chrome if not
+        pdf_links = _find_pdf_links_static(self.session, self.url)
+        if pdf_links is not None:
+            return pdf_links
         
-        # Check downloaded files
-        pdf_files = [f for f in os.listdir(downloads_dir) if f.endswith('.pdf')]
-        if pdf_files:
-            print(f"\nPDF files found in downloads directory:")
-            for pdf_file in pdf_files:
-                file_path = os.path.join(downloads_dir, pdf_file)
-                file_size = os.path.getsize(file_path)
-                print(f"  ✓ {pdf_file} ({file_size} bytes)")
+        print("Falling back to browser scraping...")
+        if self.driver is None:
+            self.driver = _create_driver(self.downloads_dir)
         else:
-            print("\nNo PDF files found in downloads directory")
+            print("Reusing running browser")
+        
+        try:
+            pdf_links = _find_pdf_links_with_browser(self.driver, self.url)
+        except Exception:
+            # Drop a broken browser so the next fetch starts a fresh one
+            self._quit_driver()
+            raise
         
-        return downloaded_files
+        # Reuse the browser session cookies for the downloads
+        for cookie in self.driver.get_cookies():
+            self.session.cookies.set(cookie['name'], cookie['value'])
         
-    except Exception as e:
-        print(f"Error occurred: {e}")
-        return []
+        return pdf_links
     
-    finally:
-        if driver:
-            try:
-                driver.quit()
-            except:
-                pass  # Ignore cleanup errors
+    def fetch(self):
+        """Find PDFs in the Most Recent Information section and download them"""
+        self.start()
+        try:
+            pdf_links = self._find_pdf_links()
+            
+            if not pdf_links:
+                print("No PDF download links found in the 'Most Recent Information' section")
+                return []
+            
+            print(f"Found {len(pdf_links)} PDF links:")
+            for link in pdf_links:
+                print(f"  - {link['description']}: {link['url']}")
+            
+            downloaded_files = _download_pdfs(self.session, pdf_links, self.downloads_dir)
+            
+            # Check downloaded files
+            pdf_files = list(Path(self.downloads_dir).glob('*.pdf'))
+            if pdf_files:
+                print(f"\nPDF files found in downloads directory:")
+                for pdf_file in pdf_files:
+                    print(f"  ✓ {pdf_file.name} ({pdf_file.stat().st_size} bytes)")
+            else:
+                print("\nNo PDF files found in downloads directory")
+            
+            return downloaded_files
+            
+        except Exception as e:
+            print(f"Error occurred: {e}")
+            return []
+
+def find_and_download_pdfs(url):
+    """Find PDFs in the Most Recent Information section and download them"""
+    with IBKRScraper(url) as scraper:
+        return scraper.fetch()
+
+def report_downloads(downloaded_files):
+    if downloaded_files:
+        print(f"\nSuccessfully processed {len(downloaded_files)} files:")
+        for file in downloaded_files:
+            print(f"  - {file}")
+    else:
+        print("\nNo files were downloaded.")
+
+MIN_DAEMON_INTERVAL = 60  # seconds; keeps daemon mode from hammering the IBKR site
+MAX_DAEMON_INTERVAL = 31 * 24 * 3600  # seconds; the metrics are published monthly
+
+def daemon_interval(value):
+    """argparse type for --daemon: seconds between fetches"""
+    try:
+        interval = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number of seconds: {value!r}")
+    if not math.isfinite(interval) or not MIN_DAEMON_INTERVAL <= interval <= MAX_DAEMON_INTERVAL:
+        raise argparse.ArgumentTypeError(
+            f"must be between {MIN_DAEMON_INTERVAL} and {MAX_DAEMON_INTERVAL} seconds, got {value}"
+        )
+    return interval
+
+def run_daemon(interval):
+    """Fetch every `interval` seconds until interrupted"""
+    print(f"Daemon mode: fetching every {interval} seconds (Ctrl+C to stop)")
+    with IBKRScraper(IBKR_METRICS_URL) as scraper:
+        try:
+            while True:
+                started = time.monotonic()
+                print(f"\n[{time.strftime('%Y-%m-%d %H:%M:%S')}] Starting fetch")
+                report_downloads(scraper.fetch())
+                time.sleep(max(0, interval - (time.monotonic() - started)))
+        except KeyboardInterrupt:
+            print("\nDaemon stopped")
 
 def main():
+    parser = argparse.ArgumentParser(description="Download the latest IBKR monthly metrics PDFs")
+    parser.add_argument('--daemon', type=daemon_interval, metavar='SECONDS',
+                        help="stay resident and re-fetch every SECONDS, reusing the browser between runs")
+    args = parser.parse_args()
+    
     print("IBKR PDF Downloader")
     print("=" * 50)
+    
+    if args.daemon is not None:
+        run_daemon(args.daemon)
+        return
+    
     print("Navigating to Interactive Brokers monthly metrics page...")
     print(f"URL: {IBKR_METRICS_URL}")
     print()
     
     downloaded_files = find_and_download_pdfs(IBKR_METRICS_URL)
-    
-    if downloaded_files:
-        print(f"\nSuccessfully processed {len(downloaded_files)} files:")
-        for file in downloaded_files:
-            print(f"  - {file}")
-    else:
-        print("\nNo files were downloaded.")
+    report_downloads(downloaded_files)
     
     print("\nDownload process completed!")
 
@@ -18,9 +18,17 @@ Usage:
 
 import os
 import re
+import mmap
+import hashlib
+import pickle
+import importlib.metadata
+import functools
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import csv
 import sys
-import pdfplumber
+import pypdfium2 as pdfium
 from pathlib import Path
 
 # ==============================================================================
@@ -103,85 +111,344 @@ class Config:
         'USA.OBD.INTERACTIVE.AVGORDER.FUTURES.M': {'source_name': ('Futures', 'Average Order Size'), 'source': 'press_release'},
     }
     
+    # Per-source views of MAPPING_CONFIG: column -> source_name
+    MONTHLY_MAP = {k: v['source_name'] for k, v in MAPPING_CONFIG.items() if v['source'] == 'monthly_brokerage'}
+    PRESS_MAP = {k: v['source_name'] for k, v in MAPPING_CONFIG.items() if v['source'] == 'press_release'}
+    
+    # Source names of the monthly brokerage metrics, in column order
+    MONTHLY_BROKERAGE_METRICS = tuple(MONTHLY_MAP.values())
+    
+    # Reverse indexes: extracted label (or (product, metric) pair) -> column
+    SOURCE_TO_COLUMN = {v: k for k, v in MONTHLY_MAP.items()}
+    PRESS_SOURCE_TO_COLUMN = {v: k for k, v in PRESS_MAP.items()}
+    
     # Month mapping
     MONTH_MAPPING = {
         1: "Jan", 2: "Feb", 3: "Mar", 4: "Apr", 5: "May", 6: "Jun",
         7: "Jul", 8: "Aug", 9: "Sep", 10: "Oct", 11: "Nov", 12: "Dec"
     }
     
-    VALID_MONTHS = list(MONTH_MAPPING.values())
+    VALID_MONTHS = frozenset(MONTH_MAPPING.values())
+    
+    # Pages read for text extraction; the brokerage table and press release figures are on page 1
+    MAX_TEXT_PAGES = 2
+    
+    # Documents with at least this many pages to read are split across worker processes
+    PARALLEL_TEXT_PAGES = 50
+    
+    # On-disk cache for parsed PDF text, words and tables, keyed by content hash
+    CACHE_DIR = Path.home() / ".cache" / "obd_ibkr"
+    
+    # Bump whenever extraction code or its settings change, so older cache entries are ignored
+    CACHE_VERSION = 1
+
+# Lower-cased full and abbreviated month names -> month number
+_MONTH_LOOKUP = {
+    **{name.lower(): i + 1 for i, name in enumerate([
+        'January', 'February', 'March', 'April', 'May', 'June',
+        'July', 'August', 'September', 'October', 'November', 'December'])},
+    **{abbr.lower(): num for num, abbr in Config.MONTH_MAPPING.items()},
+}
+
+# Patterns for extracting dates from PDF content, compiled once per process
+_DATE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    # Monthly Brokerage patterns
+    r'(\d{4})\s*%?\s*Change',                    # "2025 % Change"
+    r'ELECTRONIC\s+BROKERAGE.*?(\d{4})',         # Header with year
+
+    # Press Release patterns
+    r'for\s+(\w+)\s+(\d{4})',                    # "for August 2025"
+    r'(\w+)\s+(\d{4}),?\s*includes',             # "August 2025, includes"
+    r'(\w+)\s+\d+,\s+(\d{4})',                  # "September 2, 2025"
+    r'metrics\s+for\s+(\w+)',                   # "metrics for August"
+    r'performance\s+metrics\s+for\s+(\w+)',     # "performance metrics for August"
+
+    # Generic patterns
+    r'(\w+)\s+(\d{4})'                          # "Month Year" format
+]]
+
+_NUM_RE = re.compile(r'[\d,]+\.?\d*')
+
+# Translation table that drops currency symbols and thousands separators
+_STRIP_TBL = str.maketrans('', '', '$,')
+
+# Any month abbreviation, used to list the month columns of a header line
+_MONTH_NAME_RE = re.compile('|'.join(Config.MONTH_MAPPING.values()))
+
+# Month header line of the brokerage table, per target month: a line mentioning Jan, Feb,
+# Mar and the target month in any order
+_HEADER_RES = {
+    abbr: re.compile(r'^(?=[^\n]*Jan)(?=[^\n]*Feb)(?=[^\n]*Mar)[^\n]*' + abbr, re.MULTILINE)
+    for abbr in Config.MONTH_MAPPING.values()
+}
+
+# Whitespace-separated numeric token in a text line, e.g. "1,234", "$5.6"
+_NUMERIC_TOKEN = re.compile(r'^[\$]?[\d,]+\.?\d*$')
+
+# Numeric word inside a target column (coordinate strategy) and a cleaned table cell value
+_COORD_NUMERIC_RE = re.compile(r'^[$\d,.]+$')
+_CLEAN_NUMBER_RE = re.compile(r'^\d+\.?\d*$')
+
+# Monthly brokerage metric row patterns, by source name
+_METRIC_PATTERNS = {name: re.compile(p, re.IGNORECASE) for name, p in {
+    'Total Accounts': r'Total Accounts[^\d]*(\d+(?:,\d+)*\.?\d*)',
+    'Net New Accounts': r'Net New Accounts[^\d]*(\d+(?:,\d+)*\.?\d*)',
+    'Total Client DARTs': r'Total Client DARTs[^\d]*(\d+(?:,\d+)*)',
+    'Cleared Client DARTs': r'Cleared Client DARTs[^\d]*(\d+(?:,\d+)*)',
+    'Options Contracts': r'Options Contracts[^\d]*(\d+(?:,\d+)*)',
+    'Futures Contracts': r'Futures Contracts[^\d]*(\d+(?:,\d+)*)',
+    'Stock Shares': r'Stock Shares[^\d]*(\d+(?:,\d+)*)',
+    'Client Equity': r'Client Equity[^\d]*\$?(\d+(?:,\d+)*\.?\d*)',
+    'FDIC Program Client Credits': r'FDIC Program Client Credits[^\d]*\$?(\d+(?:,\d+)*\.?\d*)',
+    'Client Credits Held at Broker': r'Client Credits Held at Broker[^\d]*\$?(\d+(?:,\d+)*\.?\d*)',
+    'Client Credits': r'Client Credits\(\d+\)[^\d]*\$?(\d+(?:,\d+)*\.?\d*)',
+    'Client Margin Loans': r'Client Margin Loans[^\d]*\$?(\d+(?:,\d+)*\.?\d*)',
+    'Cash as % of Assets': r'Cash as % of Assets[^\d]*(\d+(?:\.?\d*))%?',
+}.items()}
+
+# All metric patterns in one scan: a zero-width lookahead per position reports every
+# metric matching anywhere in the line, with the metric identified by its group name
+_METRIC_GROUP_NAMES = {f'm{i}': name for i, name in enumerate(_METRIC_PATTERNS)}
+_ALL_METRICS_RE = re.compile(
+    '(?=' + '|'.join(f'(?P<m{i}>{pattern.pattern})' for i, pattern in enumerate(_METRIC_PATTERNS.values())) + ')',
+    re.IGNORECASE
+)
+
+# Press release patterns: narrative format (with units) first, table format as backup
+_PRIMARY_PATTERNS = {product: re.compile(p, re.MULTILINE | re.IGNORECASE) for product, p in {
+    'Stocks': r"Stocks\s+([\d,]+\s+shares)\s+\$([\d.]+)",
+    'Equity Options': r"Equity\s+Options\s+([\d.]+\s+contracts)\s+\$([\d.]+)",
+    'Futures': r"Futures\s+and\s+Future\s+Options\s+([\d.]+\s+contracts)\s+\$([\d.]+)"
+}.items()}
+_BACKUP_PATTERNS = {product: re.compile(p, re.MULTILINE | re.IGNORECASE) for product, p in {
+    'Stocks': r"Stocks\s+(\d+(?:,\d+)*)\s+shares\s+\$(\d+\.?\d*)",
+    'Equity Options': r"Equity\s+Options\s+(\d+\.?\d*)\s+contracts\s+\$(\d+\.?\d*)",
+    'Futures': r"Futures\s+(\d+\.?\d*)\s+contracts\s+\$(\d+\.?\d*)"
+}.items()}
+
+# The two CSV header rows depend only on Config, so they are built once
+_HEADER_ROW1 = ['Date'] + Config.FINAL_CSV_COLUMNS
+_HEADER_ROW2 = [''] + [Config.DESCRIPTIVE_HEADERS.get(h, "") for h in Config.FINAL_CSV_COLUMNS]
 
 # ==============================================================================
 # 2. UTILITY CLASSES AND FUNCTIONS  
 # ==============================================================================
 
 class Logger:
-    """Simple logging utility"""
+    """Simple logging utility, safe to share between threads"""
+
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _emit(level, message):
+        # One write per record, flushed immediately, so lines from parallel
+        # workers sharing stdout never split or interleave mid-line
+        with Logger._lock:
+            sys.stdout.write(f"{level}: {message}\n")
+            sys.stdout.flush()
 
     @staticmethod
     def info(message):
-        print(f"INFO: {message}")
+        Logger._emit("INFO", message)
 
     @staticmethod
     def success(message):
-        print(f"SUCCESS: {message}")
+        Logger._emit("SUCCESS", message)
 
     @staticmethod
     def warning(message):
-        print(f"WARNING: {message}")
+        Logger._emit("WARNING", message)
 
     @staticmethod
     def error(message):
-        print(f"ERROR: {message}")
+        Logger._emit("ERROR", message)
 
     @staticmethod
     def debug(message):
-        print(f"DEBUG: {message}")
+        Logger._emit("DEBUG", message)
+
+# Shared by every parser, processor and worker instead of one Logger per object
+_LOGGER = Logger()
 
 def extract_pdf_from_java_wrapper(file_path):
     """Extract actual PDF content from Java-serialized wrapper if present"""
     try:
         with open(file_path, 'rb') as f:
-            data = f.read()
+            # Check if this is a Java-wrapped PDF before mapping the rest of the file
+            if f.read(2) != b'\xac\xed':  # Java serialization magic bytes
+                return file_path  # Not a Java wrapper, return original path
+
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
-        # Check if this is a Java-wrapped PDF
-        if data.startswith(b'\xac\xed'):  # Java serialization magic bytes
+        with mm:
             # Find the PDF header
-            pdf_start = data.find(b'%PDF-')
+            pdf_start = mm.find(b'%PDF-')
             if pdf_start == -1:
                 return file_path  # No PDF content found, return original
 
             # Find the PDF end marker
-            pdf_end = data.rfind(b'%%EOF')
+            pdf_end = mm.rfind(b'%%EOF')
             if pdf_end == -1:
                 return file_path  # No PDF end marker, return original
 
-            # Extract PDF content
-            pdf_content = data[pdf_start:pdf_end + 5]
-
             # Create temporary clean PDF file
             import tempfile
             temp_fd, temp_path = tempfile.mkstemp(suffix='.pdf')
-            os.close(temp_fd)
-
-            with open(temp_path, 'wb') as f:
-                f.write(pdf_content)
+            with os.fdopen(temp_fd, 'wb') as out:
+                out.write(mm[pdf_start:pdf_end + 5])
 
-            Logger.debug(f"Extracted PDF from Java wrapper: {len(pdf_content)} bytes")
+            Logger.debug(f"Extracted PDF from Java wrapper: {pdf_end + 5 - pdf_start} bytes")
             return temp_path
 
-        # Not a Java wrapper, return original path
-        return file_path
-
     except Exception as e:
         Logger.warning(f"Could not check for Java wrapper: {e}")
         return file_path
 
+# In-process copies of parse artifacts, keyed by (kind, content hash)
+_ARTIFACTS = {}
+
+# PDFium is not thread-safe, so all pypdfium2 calls in this process go through this lock
+_PDFIUM_LOCK = threading.Lock()
+
+def _pdf_cache_key(pdf_path):
+    """SHA-256 of a PDF's bytes, hashed once per (path, mtime, size)"""
+    stat = os.stat(pdf_path)
+    return _hash_file(str(pdf_path), stat.st_mtime_ns, stat.st_size)
+
+@functools.lru_cache(maxsize=None)
+def _hash_file(pdf_path, mtime_ns, size):
+    """Stream the file through SHA-256 so memory stays bounded for large PDFs"""
+    with open(pdf_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+@functools.lru_cache(maxsize=None)
+def _cache_tag():
+    """Cache format and PDF library versions, for cache file names"""
+    versions = []
+    for package in ('pypdfium2', 'pdfplumber'):
+        try:
+            versions.append(importlib.metadata.version(package))
+        except importlib.metadata.PackageNotFoundError:
+            versions.append('none')
+    return f"v{Config.CACHE_VERSION}-" + "-".join(versions)
+
+def _cached_artifact(kind, pdf_path, extract):
+    """Return a cached parse artifact for a PDF, extracting it on a miss"""
+    key = _pdf_cache_key(pdf_path)
+    if (kind, key) in _ARTIFACTS:
+        return _ARTIFACTS[kind, key]
+
+    cache_file = Config.CACHE_DIR / f"{key}.{kind}.{_cache_tag()}.pkl"
+    try:
+        with open(cache_file, 'rb') as f:
+            value = pickle.load(f)
+    except Exception:  # Missing, truncated or unreadable entry: re-extract and overwrite it
+        value = extract(pdf_path)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = cache_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(temp_file, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            Logger.debug(f"Could not write {kind} cache: {e}")
+
+    _ARTIFACTS[kind, key] = value
+    return value
+
+def _extract_text(pdf_path, max_pages=None):
+    """Plain text of the first `max_pages` pages of a PDF (all pages if None)"""
+    kind = 'text' if max_pages is None else f'text{max_pages}'
+    return _cached_artifact(kind, pdf_path, functools.partial(_read_pdf_text, max_pages=max_pages))
+
+def _extract_words(pdf_path):
+    """Words with coordinates on the first page of a PDF"""
+    return _cached_artifact('words', pdf_path, _read_first_page_words)
+
+def _extract_tables(pdf_path):
+    """Tables detected on the first page of a PDF"""
+    return _cached_artifact('tables', pdf_path, _read_first_page_tables)
+
+def _read_pdf_text(pdf_path, max_pages=None):
+    """Extract text from the leading pages of a PDF with PDFium"""
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        try:
+            page_count = len(pdf) if max_pages is None else min(len(pdf), max_pages)
+            # Only the top-level process fans out; pair workers read serially to avoid nested pools
+            if page_count < Config.PARALLEL_TEXT_PAGES or multiprocessing.parent_process() is not None:
+                page_texts = _page_texts(pdf, 0, page_count)
+            else:
+                page_texts = None
+        finally:
+            pdf.close()
+
+    if page_texts is None:
+        page_texts = _read_pages_in_parallel(pdf_path, page_count)
+    return "\n".join(page_texts).replace("\r\n", "\n")
+
+def _page_texts(pdf, start, stop):
+    """Text of pages [start, stop) of an open PDFium document"""
+    page_texts = []
+    for index in range(start, stop):
+        page = pdf[index]
+        textpage = page.get_textpage()
+        page_texts.append(textpage.get_text_range())
+        textpage.close()
+        page.close()
+    return page_texts
+
+def _read_page_range(page_range):
+    """Worker: open the PDF separately and extract the text of one page range"""
+    # Each spawned worker is single-threaded, so it needs no _PDFIUM_LOCK
+    pdf_path, start, stop = page_range
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        return _page_texts(pdf, start, stop)
+    finally:
+        pdf.close()
+
+def _read_pages_in_parallel(pdf_path, page_count):
+    """Extract page texts across worker processes, in page order"""
+    workers = min(os.cpu_count() or 1, page_count)
+    step = -(-page_count // workers)
+    page_ranges = [(str(pdf_path), start, min(start + step, page_count)) for start in range(0, page_count, step)]
+    # Spawn rather than fork: a forked child could inherit _PDFIUM_LOCK held by another thread and block forever
+    with ProcessPoolExecutor(max_workers=len(page_ranges), mp_context=multiprocessing.get_context("spawn")) as executor:
+        return [text for chunk in executor.map(_read_page_range, page_ranges) for text in chunk]
+
+@functools.lru_cache(maxsize=None)
+def _pdfplumber():
+    """Import pdfplumber on first use"""
+    import pdfplumber
+    return pdfplumber
+
+def _read_first_page_words(pdf_path):
+    with _pdfplumber().open(pdf_path) as pdf:
+        if not pdf.pages:
+            return None
+        page = pdf.pages[0]
+        words = page.extract_words(x_tolerance=3, y_tolerance=3)
+        page.flush_cache()  # Drop the parsed layout objects; only the words are kept
+        return words
+
+def _read_first_page_tables(pdf_path):
+    with _pdfplumber().open(pdf_path) as pdf:
+        if not pdf.pages:
+            return []
+        page = pdf.pages[0]
+        tables = page.extract_tables()
+        page.flush_cache()
+        return tables
+
 def clean_numeric_value(value_str):
     """Clean and normalize numeric values"""
-    if not value_str:
-        return ""
-    return re.sub(r'[$,]', '', str(value_str)).strip()
+    return str(value_str).translate(_STRIP_TBL).strip() if value_str else ""
 
 def validate_date_params(year, month_num):
     """Validate year and month parameters"""
@@ -202,39 +469,12 @@ def validate_date_params(year, month_num):
 def extract_date_from_content(text, logger=None):
     """Extract year and month from PDF content as fallback"""
     if logger is None:
-        logger = Logger()
-
-    month_name_to_num = {
-        'january': 1, 'february': 2, 'march': 3, 'april': 4,
-        'may': 5, 'june': 6, 'july': 7, 'august': 8,
-        'september': 9, 'october': 10, 'november': 11, 'december': 12,
-        'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4,
-        'may': 5, 'jun': 6, 'jul': 7, 'aug': 8,
-        'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-    }
-
-    # Patterns for extracting dates from content
-    patterns = [
-        # Monthly Brokerage patterns
-        r'(\d{4})\s*%?\s*Change',                    # "2025 % Change"
-        r'ELECTRONIC\s+BROKERAGE.*?(\d{4})',         # Header with year
-
-        # Press Release patterns
-        r'for\s+(\w+)\s+(\d{4})',                    # "for August 2025"
-        r'(\w+)\s+(\d{4}),?\s*includes',             # "August 2025, includes"
-        r'(\w+)\s+\d+,\s+(\d{4})',                  # "September 2, 2025"
-        r'metrics\s+for\s+(\w+)',                   # "metrics for August"
-        r'performance\s+metrics\s+for\s+(\w+)',     # "performance metrics for August"
-
-        # Generic patterns
-        r'(\w+)\s+(\d{4})'                          # "Month Year" format
-    ]
+        logger = _LOGGER
 
     text_lower = text.lower()
 
-    for pattern in patterns:
-        matches = re.finditer(pattern, text_lower, re.IGNORECASE)
-        for match in matches:
+    for pattern in _DATE_PATTERNS:
+        for match in pattern.finditer(text_lower):
             groups = match.groups()
 
             if len(groups) == 1:
@@ -251,17 +491,17 @@ def extract_date_from_content(text, logger=None):
                 if group1.isdigit() and len(group1) == 4:
                     # First group is year, second might be month
                     year = int(group1)
-                    if group2.lower() in month_name_to_num:
-                        month = month_name_to_num[group2.lower()]
-                        logger.debug(f"Extracted date from content: {year}-{month:02d} using pattern '{pattern}'")
+                    if group2.lower() in _MONTH_LOOKUP:
+                        month = _MONTH_LOOKUP[group2.lower()]
+                        logger.debug(f"Extracted date from content: {year}-{month:02d} using pattern '{pattern.pattern}'")
                         return year, month
 
                 elif group2.isdigit() and len(group2) == 4:
                     # Second group is year, first might be month
                     year = int(group2)
-                    if group1.lower() in month_name_to_num:
-                        month = month_name_to_num[group1.lower()]
-                        logger.debug(f"Extracted date from content: {year}-{month:02d} using pattern '{pattern}'")
+                    if group1.lower() in _MONTH_LOOKUP:
+                        month = _MONTH_LOOKUP[group1.lower()]
+                        logger.debug(f"Extracted date from content: {year}-{month:02d} using pattern '{pattern.pattern}'")
                         return year, month
 
     logger.debug("Could not extract date from PDF content")
@@ -270,33 +510,25 @@ def extract_date_from_content(text, logger=None):
 def detect_latest_month_from_data(text, year, logger=None):
     """Detect the latest month with data in Monthly Brokerage PDF"""
     if logger is None:
-        logger = Logger()
-
-    lines = text.split('\n')
+        logger = _LOGGER
 
     # Find the month header line
-    month_header_line = None
-    for line in lines:
-        if all(month in line for month in ['Jan', 'Feb', 'Mar']) and 'Aug' in line:
-            month_header_line = line
-            break
-
-    if not month_header_line:
+    if not _HEADER_RES['Aug'].search(text):
         return None
 
     # Find data lines and check which months have data
     months_with_data = []
     month_order = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
 
-    for line in lines:
+    for line in text.split('\n'):
         # Skip header and non-data lines
-        if any(month in line for month in month_order[:3]):
+        if 'Jan' in line or 'Feb' in line or 'Mar' in line:
             continue
         if not any(char.isdigit() for char in line):
             continue
 
         # Count numeric values in the line
-        numeric_parts = re.findall(r'[\d,]+\.?\d*', line)
+        numeric_parts = _NUM_RE.findall(line)
         if len(numeric_parts) >= 8:  # If we have at least 8 months of data
             months_with_data = month_order[:len(numeric_parts)]
             break
@@ -317,9 +549,33 @@ class PDFParser:
     """Main PDF parsing engine with multiple strategies"""
     
     def __init__(self):
-        self.logger = Logger()
+        self.logger = _LOGGER
+        
+        # Monthly brokerage metric names with their distinctive (4+ letter) words, lower-cased once
+        self.metric_source_tokens = [
+            (name, [word for word in name.lower().split() if len(word) > 3])
+            for name in Config.MONTHLY_BROKERAGE_METRICS
+        ]
+        
+        # All keywords in one pattern, longest first: the zero-width lookahead reports the
+        # longest keyword starting at each position, and every keyword contained in it is
+        # then known to occur as well
+        keywords = sorted({word for _, words in self.metric_source_tokens for word in words}, key=len, reverse=True)
+        self.metric_keyword_re = re.compile('(?=(' + '|'.join(map(re.escape, keywords)) + '))')
+        self.metric_keyword_hits = {
+            keyword: frozenset(name for name, words in self.metric_source_tokens
+                               if any(word in keyword for word in words))
+            for keyword in keywords
+        }
+    
+    def _match_metric_names(self, text):
+        """Names of the metrics whose keywords occur in the text"""
+        hits = set()
+        for match in self.metric_keyword_re.finditer(text):
+            hits |= self.metric_keyword_hits[match.group(1)]
+        return hits
     
-    def parse_monthly_brokerage_data(self, pdf_path, target_year, target_month_num):
+    def parse_monthly_brokerage_data(self, pdf_path, target_year, target_month_num, precomputed_text=None):
         """
         Main entry point for monthly brokerage data parsing.
         Uses multiple strategies in order of reliability.
@@ -340,35 +596,37 @@ class PDFParser:
         temp_file_created = clean_pdf_path != pdf_path
 
         try:
-            with pdfplumber.open(clean_pdf_path) as pdf:
-                if not pdf.pages:
-                    return {"Error": "PDF has no pages"}
-                
-                # Strategy 1: Text-based extraction (most reliable)
-                self.logger.info("Trying text-based extraction...")
-                result = self._parse_using_text_extraction(pdf, target_year, target_month_abbr)
-                
-                if result and "Error" not in result and len(result) >= 5:
-                    self.logger.success(f"Text extraction successful: {len(result)} metrics found")
-                    return result
-                
-                # Strategy 2: Coordinate-based extraction
-                self.logger.warning("Text extraction insufficient, trying coordinate-based...")
-                result = self._parse_using_coordinates(pdf, target_year, target_month_abbr)
-                
-                if result and "Error" not in result and len(result) >= 5:
-                    self.logger.success(f"Coordinate extraction successful: {len(result)} metrics found")
-                    return result
-                
-                # Strategy 3: Table extraction
-                self.logger.warning("Coordinate extraction insufficient, trying table extraction...")
-                result = self._parse_using_table_extraction(pdf, target_year, target_month_abbr)
-                
-                if result and "Error" not in result:
-                    self.logger.success(f"Table extraction successful: {len(result)} metrics found")
-                    return result
-                
-                return {"Error": "All parsing strategies failed to extract sufficient data"}
+            # Strategy 1: Text-based extraction (most reliable), reusing the caller's text if given
+            self.logger.info("Trying text-based extraction...")
+            full_text = precomputed_text if precomputed_text is not None else _extract_text(clean_pdf_path, Config.MAX_TEXT_PAGES)
+            result = self._parse_using_text_extraction(full_text, target_year, target_month_abbr)
+            
+            if result and "Error" not in result and len(result) >= 5:
+                self.logger.success(f"Text extraction successful: {len(result)} metrics found")
+                return result
+            
+            # The layout-aware fallbacks need pdfplumber's word and table extraction
+            words = _extract_words(clean_pdf_path)
+            if words is None:
+                return {"Error": "PDF has no pages"}
+            
+            # Strategy 2: Coordinate-based extraction
+            self.logger.warning("Text extraction insufficient, trying coordinate-based...")
+            result = self._parse_using_coordinates(words, target_year, target_month_abbr)
+            
+            if result and "Error" not in result and len(result) >= 5:
+                self.logger.success(f"Coordinate extraction successful: {len(result)} metrics found")
+                return result
+            
+            # Strategy 3: Table extraction
+            self.logger.warning("Coordinate extraction insufficient, trying table extraction...")
+            result = self._parse_using_table_extraction(_extract_tables(clean_pdf_path), target_year, target_month_abbr)
+            
+            if result and "Error" not in result:
+                self.logger.success(f"Table extraction successful: {len(result)} metrics found")
+                return result
+            
+            return {"Error": "All parsing strategies failed to extract sufficient data"}
 
         except Exception as e:
             return {"Error": f"PDF processing failed: {str(e)}"}
@@ -380,16 +638,9 @@ class PDFParser:
                 except:
                     pass
     
-    def _parse_using_text_extraction(self, pdf, target_year, target_month_abbr):
+    def _parse_using_text_extraction(self, full_text, target_year, target_month_abbr):
         """Strategy 1: Text extraction with regex patterns"""
         try:
-            # Extract all text from PDF
-            full_text = ""
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    full_text += page_text + "\n"
-            
             if not full_text.strip():
                 return {"Error": "No text extracted from PDF"}
             
@@ -397,38 +648,27 @@ class PDFParser:
             if str(target_year) not in full_text:
                 return {"Error": f"Target year {target_year} not found in PDF"}
             
-            # Split into lines and find header
-            lines = full_text.split('\n')
-            header_line_idx = -1
-            
-            for i, line in enumerate(lines):
-                if all(month in line for month in ['Jan', 'Feb', 'Mar']) and target_month_abbr in line:
-                    header_line_idx = i
-                    break
-            
-            if header_line_idx == -1:
+            # Jump straight to the header line, then split only the lines that follow it
+            header_match = _HEADER_RES[target_month_abbr].search(full_text)
+            if not header_match:
                 return {"Error": f"Could not find header line with {target_month_abbr}"}
             
+            header_start = header_match.start()
+            header_end = full_text.find('\n', header_start)
+            if header_end == -1:
+                header_end = len(full_text)
+            lines = full_text[header_end + 1:].split('\n', 25)[:25]
+            
             # Determine target month column index with improved logic
-            header_line = lines[header_line_idx]
+            header_line = full_text[header_start:header_end]
             self.logger.debug(f"Header line: {header_line}")
 
-            # Split header by whitespace to get proper column alignment
-            header_parts = header_line.split()
-            month_positions = []
-
-            # Find month positions in header to validate target month exists
-            for i, part in enumerate(header_parts):
-                for month in Config.VALID_MONTHS:
-                    if month in part:
-                        month_positions.append((month, i))
-                        break
-
-            self.logger.debug(f"Found months in header: {month_positions}")
+            # Read the month columns of the header in a single regex pass
+            header_months = _MONTH_NAME_RE.findall(header_line)
+            self.logger.debug(f"Found months in header: {header_months}")
 
             # Verify target month exists in header
-            target_month_found = any(month == target_month_abbr for month, _ in month_positions)
-            if not target_month_found:
+            if target_month_abbr not in header_months:
                 return {"Error": f"Could not locate {target_month_abbr} in header"}
 
             # Map target month to data column index (0-based)
@@ -444,30 +684,15 @@ class PDFParser:
 
             self.logger.debug(f"Target month {target_month_abbr} mapped to data column index: {target_month_idx}")
             
-            # Define metric patterns with improved robustness
-            metric_patterns = {
-                'Total Accounts': r'Total Accounts[^\d]*(\d+(?:,\d+)*\.?\d*)',
-                'Net New Accounts': r'Net New Accounts[^\d]*(\d+(?:,\d+)*\.?\d*)',
-                'Total Client DARTs': r'Total Client DARTs[^\d]*(\d+(?:,\d+)*)',
-                'Cleared Client DARTs': r'Cleared Client DARTs[^\d]*(\d+(?:,\d+)*)', 
-                'Options Contracts': r'Options Contracts[^\d]*(\d+(?:,\d+)*)',
-                'Futures Contracts': r'Futures Contracts[^\d]*(\d+(?:,\d+)*)',
-                'Stock Shares': r'Stock Shares[^\d]*(\d+(?:,\d+)*)',
-                'Client Equity': r'Client Equity[^\d]*\$?(\d+(?:,\d+)*\.?\d*)',
-                'FDIC Program Client Credits': r'FDIC Program Client Credits[^\d]*\$?(\d+(?:,\d+)*\.?\d*)',
-                'Client Credits Held at Broker': r'Client Credits Held at Broker[^\d]*\$?(\d+(?:,\d+)*\.?\d*)',
-                'Client Credits': r'Client Credits\(\d+\)[^\d]*\$?(\d+(?:,\d+)*\.?\d*)',
-                'Client Margin Loans': r'Client Margin Loans[^\d]*\$?(\d+(?:,\d+)*\.?\d*)',
-                'Cash as % of Assets': r'Cash as % of Assets[^\d]*(\d+(?:\.?\d*))%?',
-            }
-            
             extracted_data = {}
             
-            # Process each line after header
-            for line_idx in range(header_line_idx + 1, min(header_line_idx + 25, len(lines))):
-                if line_idx >= len(lines):
+            # Process each line after header, stopping once every metric has been found
+            remaining = set(_METRIC_PATTERNS)
+            remaining.add('Cleared Avg. DART per Account (Annualized)')
+            for line_idx in range(min(24, len(lines))):
+                if not remaining:
                     break
-                    
+                
                 line = lines[line_idx].strip()
                 if not line:
                     continue
@@ -476,60 +701,51 @@ class PDFParser:
                 combined_line = line
                 if line_idx + 1 < len(lines):
                     next_line = lines[line_idx + 1].strip()
-                    if next_line and ("Annualized" in next_line or len(line.split()) < 3):
+                    if next_line and ("Annualized" in next_line or line.count(" ") < 2):
                         combined_line = line + " " + next_line
                 
-                # Test each metric pattern
-                for metric_name, pattern in metric_patterns.items():
-                    if metric_name in extracted_data:  # Skip if already found
-                        continue
-
-                    if re.search(pattern, combined_line, re.IGNORECASE):
-                        # Split line by whitespace to get proper alignment with header
-                        line_parts = combined_line.split()
-
-                        # Find numeric parts only
-                        numeric_parts = []
-                        for part in line_parts:
-                            # Check if part is numeric (with commas, decimals, dollar signs)
-                            if re.match(r'^[\$]?[\d,]+\.?\d*$', part):
-                                numeric_parts.append(part.replace('$', '').replace(',', ''))
-
-                        self.logger.debug(f"Line: {combined_line}")
-                        self.logger.debug(f"Numeric parts: {numeric_parts}")
-                        self.logger.debug(f"Target index: {target_month_idx}, Available: {len(numeric_parts)}")
-
-                        if numeric_parts and len(numeric_parts) > target_month_idx:
-                            value = clean_numeric_value(numeric_parts[target_month_idx])
-                            if value:
-                                extracted_data[metric_name] = value
-                                self.logger.debug(f"Found {metric_name}: {value} (from index {target_month_idx})")
+                # Test all metric patterns in a single scan of the line
+                matched_metrics = {_METRIC_GROUP_NAMES[m.lastgroup] for m in _ALL_METRICS_RE.finditer(combined_line)}
+                matched_metrics.difference_update(extracted_data)  # Skip metrics already found
                 
                 # Special handling for "Cleared Avg. DART per Account (Annualized)"
-                if ("Cleared Avg. DART per Account" in line or "Annualized" in line) and 'Cleared Avg. DART per Account (Annualized)' not in extracted_data:
-                    line_parts = combined_line.split()
-                    numeric_parts = []
-                    for part in line_parts:
-                        if re.match(r'^[\$]?[\d,]+\.?\d*$', part):
-                            numeric_parts.append(part.replace('$', '').replace(',', ''))
-
-                    if numeric_parts and len(numeric_parts) > target_month_idx:
-                        value = clean_numeric_value(numeric_parts[target_month_idx])
-                        if value:
-                            extracted_data['Cleared Avg. DART per Account (Annualized)'] = value
-                            self.logger.debug(f"Found DART per Account: {value} (from index {target_month_idx})")
+                wants_dart = (("Cleared Avg. DART per Account" in line or "Annualized" in line)
+                              and 'Cleared Avg. DART per Account (Annualized)' not in extracted_data)
+                
+                if not matched_metrics and not wants_dart:
+                    continue
+                
+                # Tokenize the line once; every metric on it reads the same month column
+                numeric_parts = [part.translate(_STRIP_TBL) for part in combined_line.split() if _NUMERIC_TOKEN.match(part)]
+                value = None
+                if len(numeric_parts) > target_month_idx:
+                    value = clean_numeric_value(numeric_parts[target_month_idx])
+                
+                if matched_metrics:
+                    self.logger.debug(f"Line: {combined_line}")
+                    self.logger.debug(f"Numeric parts: {numeric_parts}")
+                    self.logger.debug(f"Target index: {target_month_idx}, Available: {len(numeric_parts)}")
+                
+                if value:
+                    for metric_name in _METRIC_PATTERNS:
+                        if metric_name in matched_metrics:
+                            extracted_data[metric_name] = value
+                            remaining.discard(metric_name)
+                            self.logger.debug(f"Found {metric_name}: {value} (from index {target_month_idx})")
+                    
+                    if wants_dart:
+                        extracted_data['Cleared Avg. DART per Account (Annualized)'] = value
+                        remaining.discard('Cleared Avg. DART per Account (Annualized)')
+                        self.logger.debug(f"Found DART per Account: {value} (from index {target_month_idx})")
             
             return extracted_data
             
         except Exception as e:
             return {"Error": f"Text extraction failed: {str(e)}"}
     
-    def _parse_using_coordinates(self, pdf, target_year, target_month_abbr):
+    def _parse_using_coordinates(self, words, target_year, target_month_abbr):
         """Strategy 2: Coordinate-based extraction (fallback)"""
         try:
-            page = pdf.pages[0]
-            words = page.extract_words(x_tolerance=3, y_tolerance=3)
-            
             if not words:
                 return {"Error": "No words extracted from PDF"}
             
@@ -568,47 +784,41 @@ class PDFParser:
             
             # Extract data using coordinates
             extracted_data = {}
-            numeric_pattern = re.compile(r'^[$\d,.]+$')
-            metric_source_names = [v['source_name'] for v in Config.MAPPING_CONFIG.values() 
-                                 if v.get('source') == 'monthly_brokerage']
             
-            # Group words by row (Y position)  
+            # Group words by row (Y position) in one pass, noting each row's first
+            # numeric word inside the target column as we go
             rows = {}
             for w in words:
                 row_key = round(w["top"] / 3) * 3
-                if row_key not in rows:
-                    rows[row_key] = []
-                rows[row_key].append(w)
+                row = rows.get(row_key)
+                if row is None:
+                    row = rows[row_key] = [[], None]
+                row[0].append(w["text"])
+                if row[1] is None and target_col_start <= w["x0"] < target_col_end and _COORD_NUMERIC_RE.match(w["text"]):
+                    row[1] = w["text"]
             
-            # Process each row
-            for y_pos, row_words in rows.items():
-                row_text = " ".join([w["text"] for w in row_words]).lower()
+            # Process each row that has a value in the target column
+            for row_texts, cell_text in rows.values():
+                if cell_text is None:
+                    continue
+                value = clean_numeric_value(cell_text)
+                if not value:
+                    continue
                 
-                for metric_name in metric_source_names:
-                    metric_words = metric_name.lower().split()
-                    if any(word in row_text for word in metric_words if len(word) > 3):
-                        # Find numeric values in target column
-                        numeric_words = [w for w in row_words 
-                                       if numeric_pattern.match(w["text"]) and 
-                                       target_col_start <= w["x0"] < target_col_end]
-                        
-                        if numeric_words:
-                            value = clean_numeric_value(numeric_words[0]["text"])
-                            if value:
-                                extracted_data[metric_name] = value
-                                self.logger.debug(f"Coordinate: {metric_name} = {value}")
+                matched_names = self._match_metric_names(" ".join(row_texts).lower())
+                for metric_name, _ in self.metric_source_tokens:
+                    if metric_name in matched_names:
+                        extracted_data[metric_name] = value
+                        self.logger.debug(f"Coordinate: {metric_name} = {value}")
             
             return extracted_data
             
         except Exception as e:
             return {"Error": f"Coordinate extraction failed: {str(e)}"}
     
-    def _parse_using_table_extraction(self, pdf, target_year, target_month_abbr):
+    def _parse_using_table_extraction(self, tables, target_year, target_month_abbr):
         """Strategy 3: Table-based extraction (last resort)"""
         try:
-            page = pdf.pages[0]
-            tables = page.extract_tables()
-            
             if not tables:
                 return {"Error": "No tables found in PDF"}
             
@@ -635,9 +845,6 @@ class PDFParser:
                     continue
                 
                 # Extract data rows
-                metric_source_names = [v['source_name'] for v in Config.MAPPING_CONFIG.values() 
-                                     if v.get('source') == 'monthly_brokerage']
-                
                 for row_idx in range(header_row_idx + 1, len(table)):
                     row = table[row_idx]
                     if not row or len(row) <= target_month_col:
@@ -650,10 +857,11 @@ class PDFParser:
                         continue
                     
                     # Match against known metrics
-                    for metric_name in metric_source_names:
-                        if any(word.lower() in metric_cell.lower() for word in metric_name.split() if len(word) > 3):
+                    matched_names = self._match_metric_names(metric_cell.lower())
+                    for metric_name, _ in self.metric_source_tokens:
+                        if metric_name in matched_names:
                             clean_value = clean_numeric_value(value_cell)
-                            if clean_value and re.match(r'^\d+\.?\d*$', clean_value):
+                            if clean_value and _CLEAN_NUMBER_RE.match(clean_value):
                                 extracted_data[metric_name] = clean_value
                                 self.logger.debug(f"Table: {metric_name} = {clean_value}")
             
@@ -669,50 +877,19 @@ class PDFParser:
         temp_file_created = clean_pdf_path != pdf_path
 
         try:
-            with pdfplumber.open(clean_pdf_path) as pdf:
-                report_text = "\n".join(page.extract_text() or "" for page in pdf.pages)
+            # The figures are normally on the first page; only read the rest if some are missing
+            report_text = _extract_text(clean_pdf_path, Config.MAX_TEXT_PAGES)
+            data = self._match_press_release_products(report_text)
+            
+            if len(data) < len(_PRIMARY_PATTERNS):
+                full_text = _extract_text(clean_pdf_path)
+                if len(full_text) > len(report_text):
+                    report_text = full_text
+                    data = self._match_press_release_products(report_text)
 
             if not report_text.strip():
                 return {"Error": "No text extracted from press release PDF"}
             
-            data = {}
-            
-            # Primary patterns (narrative format)
-            primary_patterns = {
-                'Stocks': r"Stocks\s+([\d,]+\s+shares)\s+\$([\d.]+)",
-                'Equity Options': r"Equity\s+Options\s+([\d.]+\s+contracts)\s+\$([\d.]+)",
-                'Futures': r"Futures\s+and\s+Future\s+Options\s+([\d.]+\s+contracts)\s+\$([\d.]+)"
-            }
-            
-            # Backup patterns (table format)
-            backup_patterns = {
-                'Stocks': r"Stocks\s+(\d+(?:,\d+)*)\s+shares\s+\$(\d+\.?\d*)",
-                'Equity Options': r"Equity\s+Options\s+(\d+\.?\d*)\s+contracts\s+\$(\d+\.?\d*)",
-                'Futures': r"Futures\s+(\d+\.?\d*)\s+contracts\s+\$(\d+\.?\d*)"
-            }
-            
-            # Try primary patterns first, then backup
-            for pattern_name, patterns_dict in [("primary", primary_patterns), ("backup", backup_patterns)]:
-                for product, pattern in patterns_dict.items():
-                    if product not in data:  # Only if not already found
-                        match = re.search(pattern, report_text, re.MULTILINE | re.IGNORECASE)
-                        if match:
-                            self.logger.debug(f"Found {product} using {pattern_name} pattern")
-                            
-                            if pattern_name == "backup":
-                                # Backup pattern: numbers only
-                                order_size = match.group(1).replace(',', '')
-                                commission = match.group(2)
-                            else:
-                                # Primary pattern: with units
-                                order_size = match.group(1).replace(" shares", "").replace(" contracts", "").replace(',', '').strip()
-                                commission = match.group(2).strip()
-                            
-                            data[product] = {
-                                'Average Order Size': order_size,
-                                'Average Commission': commission
-                            }
-            
             if not data:
                 self.logger.warning("No commission/order size data extracted from press release")
             else:
@@ -729,6 +906,36 @@ class PDFParser:
                     os.unlink(clean_pdf_path)
                 except:
                     pass
+    
+    def _match_press_release_products(self, report_text):
+        """Extract order size and commission per product from press release text"""
+        data = {}
+        
+        # Try primary patterns first, then backup
+        for pattern_name, patterns_dict in [("primary", _PRIMARY_PATTERNS), ("backup", _BACKUP_PATTERNS)]:
+            if len(data) == len(patterns_dict):  # Every product found; skip the backup patterns
+                break
+            for product, pattern in patterns_dict.items():
+                if product not in data:  # Only if not already found
+                    match = pattern.search(report_text)
+                    if match:
+                        self.logger.debug(f"Found {product} using {pattern_name} pattern")
+                        
+                        if pattern_name == "backup":
+                            # Backup pattern: numbers only
+                            order_size = match.group(1).translate(_STRIP_TBL)
+                            commission = match.group(2)
+                        else:
+                            # Primary pattern: with units
+                            order_size = match.group(1).split()[0].translate(_STRIP_TBL)  # Drop the unit
+                            commission = match.group(2).strip()
+                        
+                        data[product] = {
+                            'Average Order Size': order_size,
+                            'Average Commission': commission
+                        }
+        
+        return data
 
 # ==============================================================================
 # 4. DATA PROCESSING AND OUTPUT
@@ -738,20 +945,15 @@ class DataProcessor:
     """Handles data processing and CSV output generation"""
     
     def __init__(self):
-        self.logger = Logger()
+        self.logger = _LOGGER
     
     def create_csv_output(self, final_data, date_str, filename):
         """Create standardized CSV output"""
         try:
-            header_row1 = ['Date'] + Config.FINAL_CSV_COLUMNS
-            header_row2 = [''] + [Config.DESCRIPTIVE_HEADERS.get(h, "") for h in Config.FINAL_CSV_COLUMNS]
             data_row = [date_str] + [final_data.get(h, "") for h in Config.FINAL_CSV_COLUMNS]
             
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(header_row1)
-                writer.writerow(header_row2)
-                writer.writerow(data_row)
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 16) as csvfile:
+                csv.writer(csvfile).writerows((_HEADER_ROW1, _HEADER_ROW2, data_row))
             
             self.logger.success(f"Created CSV file: {filename}")
             return True
@@ -765,6 +967,7 @@ class DataProcessor:
         # Primary: Extract from filename
         target_year = None
         target_month_num = None
+        brokerage_text = None  # Reused by the parser if fallback detection extracts it
 
         if date_prefix and len(date_prefix) == 6 and date_prefix.isdigit():
             target_year = date_prefix[:4]
@@ -779,9 +982,7 @@ class DataProcessor:
 
             # Try Monthly Brokerage PDF first
             try:
-                import pdfplumber
-                with pdfplumber.open(brokerage_pdf_path) as pdf:
-                    brokerage_text = "\n".join(page.extract_text() or "" for page in pdf.pages)
+                brokerage_text = _extract_text(brokerage_pdf_path, Config.MAX_TEXT_PAGES)
 
                 # Extract year from brokerage content
                 fallback_year, fallback_month = extract_date_from_content(brokerage_text, self.logger)
@@ -804,8 +1005,7 @@ class DataProcessor:
             # Try Press Release PDF if still no date
             if not target_year or not target_month_num:
                 try:
-                    with pdfplumber.open(press_release_pdf_path) as pdf:
-                        press_text = "\n".join(page.extract_text() or "" for page in pdf.pages)
+                    press_text = _extract_text(press_release_pdf_path, Config.MAX_TEXT_PAGES)
 
                     fallback_year, fallback_month = extract_date_from_content(press_text, self.logger)
 
@@ -839,7 +1039,7 @@ class DataProcessor:
         parser = PDFParser()
         
         # Parse both PDFs
-        brokerage_data = parser.parse_monthly_brokerage_data(brokerage_pdf_path, target_year, target_month_num)
+        brokerage_data = parser.parse_monthly_brokerage_data(brokerage_pdf_path, target_year, target_month_num, brokerage_text)
         press_release_data = parser.parse_press_release(press_release_pdf_path)
         
         # Check for critical errors
@@ -853,27 +1053,28 @@ class DataProcessor:
             press_release_data = {}
         
         # Map extracted data to final CSV format
-        final_mapped_data = {}
-        missing_data = []
+        final_mapped_data = dict.fromkeys(Config.FINAL_CSV_COLUMNS, "")
+
+        for source_name, value in brokerage_data.items():
+            csv_header = Config.SOURCE_TO_COLUMN.get(source_name)
+            if csv_header:
+                final_mapped_data[csv_header] = value
 
-        for csv_header in Config.FINAL_CSV_COLUMNS:
-            config = Config.MAPPING_CONFIG.get(csv_header, {})
-            value = ""
-
-            if config:
-                source_name = config['source_name']
-                if config['source'] == 'monthly_brokerage':
-                    value = brokerage_data.get(source_name, "")
-                    if not value:
-                        missing_data.append(f"Monthly: {source_name}")
-                elif config['source'] == 'press_release':
-                    if isinstance(source_name, tuple):
-                        product, metric_type = source_name
-                        value = press_release_data.get(product, {}).get(metric_type, "")
-                        if not value:
-                            missing_data.append(f"Press Release: {product} {metric_type}")
-
-            final_mapped_data[csv_header] = value
+        for product, metrics in press_release_data.items():
+            for metric_type, value in metrics.items():
+                csv_header = Config.PRESS_SOURCE_TO_COLUMN.get((product, metric_type))
+                if csv_header:
+                    final_mapped_data[csv_header] = value
+
+        missing_data = []
+        for csv_header, value in final_mapped_data.items():
+            if value:
+                continue
+            if csv_header in Config.MONTHLY_MAP:
+                missing_data.append(f"Monthly: {Config.MONTHLY_MAP[csv_header]}")
+            elif csv_header in Config.PRESS_MAP:
+                product, metric_type = Config.PRESS_MAP[csv_header]
+                missing_data.append(f"Press Release: {product} {metric_type}")
 
         # Calculate Cash as % of Assets: (Client Credits Total / Client Equity) * 100
         credits_total = final_mapped_data.get('USA.OBD.INTERACTIVE.ACCOUNTLEVEL.CREDITSTOTAL.M', '')
@@ -919,125 +1120,195 @@ class DataProcessor:
 # 5. FILE DISCOVERY AND BATCH PROCESSING
 # ==============================================================================
 
+# Directory scanned for report pairs; fixed for the life of the process
+_SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Report file names: YYYYMM followed by the report type, matched against undecoded (bytes) names
+_PDF_PAIR_RE_B = re.compile(rb"(\d{6})(MetricsPressRelease|MonthlyBrokerageData)\.pdf$", re.IGNORECASE)
+
+def _walk_pdf_dirs(root):
+    """Yield (directory, PDF entries) for root and its subdirectories"""
+    pending = [os.fsencode(root)]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                subdirs, pdf_entries = [], []
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.lower().endswith(b'.pdf') and entry.is_file():
+                        pdf_entries.append(entry)
+        except OSError:
+            continue  # Unreadable directory, skip it like Path.rglob does
+        yield directory, pdf_entries
+        pending.extend(reversed(subdirs))
+
+@functools.lru_cache(maxsize=None)
+def _data_processor():
+    """DataProcessor is stateless, so each process shares a single instance"""
+    return DataProcessor()
+
+def _process_pdf_pair(pair):
+    """Process one PDF pair in a worker process"""
+    brokerage_pdf_path, press_release_pdf_path, date_prefix = pair
+    return _data_processor().process_pdf_pair(brokerage_pdf_path, press_release_pdf_path, date_prefix)
+
 class FileManager:
     """Handles PDF file discovery and batch processing"""
     
     def __init__(self):
-        self.logger = Logger()
-        self.processor = DataProcessor()
+        self.logger = _LOGGER
+        self.processor = _data_processor()
     
     def find_and_process_all_reports(self):
         """Scan for PDF pairs and process them"""
         self.logger.info("Scanning for PDF report pairs...")
         
-        script_dir = Path(__file__).parent
-        processed_files = set()
-        successful_processing = 0
+        # One pair per month: the output CSV is per month, so any later copy of an already paired
+        # month (another directory, a symlink or a hardlink) is skipped
+        processed_prefixes = set()
+        pending_pairs = []
         
         # Walk through directories
-        for root in [script_dir] + list(script_dir.rglob("*")):
-            if not root.is_dir():
-                continue
-                
-            self.logger.debug(f"Checking directory: {root}")
+        match_pair_name = _PDF_PAIR_RE_B.match
+        for root, pdf_entries in _walk_pdf_dirs(_SCRIPT_DIR):
+            self.logger.debug(f"Checking directory: {os.fsdecode(root)}")
             report_groups = {}
             
             # Find PDF files with correct naming pattern
-            for file_path in root.glob("*.pdf"):
-                match = re.match(r"(\d{6})(MetricsPressRelease|MonthlyBrokerageData)\.pdf", 
-                               file_path.name, re.IGNORECASE)
+            for entry in pdf_entries:
+                match = match_pair_name(entry.name)
                 if match:
-                    date_prefix, report_type = match.groups()
-                    self.logger.debug(f"Found: {file_path.name} -> {date_prefix} {report_type}")
+                    date_prefix, report_type = (group.decode('ascii') for group in match.groups())
+                    if date_prefix in processed_prefixes:
+                        continue  # Month already paired in an earlier directory
+                    self.logger.debug(f"Found: {os.fsdecode(entry.name)} -> {date_prefix} {report_type}")
                     
                     if date_prefix not in report_groups:
                         report_groups[date_prefix] = {}
-                    report_groups[date_prefix][report_type] = file_path
+                    report_groups[date_prefix][report_type] = entry
+            
+            if not report_groups:
+                continue
             
             # Process complete pairs
-            for date_prefix, paths in report_groups.items():
+            for date_prefix, entries in report_groups.items():
                 required_types = ['MetricsPressRelease', 'MonthlyBrokerageData']
                 
-                if all(report_type in paths for report_type in required_types):
-                    file_pair_key = tuple(sorted(str(p) for p in paths.values()))
-                    
-                    if file_pair_key in processed_files:
-                        continue
-                    
+                if all(report_type in entries for report_type in required_types):
                     self.logger.info(f"Found complete pair for {date_prefix}")
                     
-                    success = self.processor.process_pdf_pair(
-                        paths['MonthlyBrokerageData'], 
-                        paths['MetricsPressRelease'], 
+                    pending_pairs.append((
+                        Path(os.fsdecode(entries['MonthlyBrokerageData'].path)), 
+                        Path(os.fsdecode(entries['MetricsPressRelease'].path)), 
                         date_prefix
-                    )
-                    
-                    if success:
-                        successful_processing += 1
-                    
-                    processed_files.add(file_pair_key)
+                    ))
+                    processed_prefixes.add(date_prefix)
                 else:
-                    missing = [t for t in required_types if t not in paths]
+                    missing = [t for t in required_types if t not in entries]
                     self.logger.warning(f"Incomplete pair for {date_prefix}, missing: {missing}")
         
+        # Process pairs; independent months run in parallel worker processes when there is more than one CPU
+        max_workers = min(len(pending_pairs), os.cpu_count() or 1)
+        if max_workers > 1:
+            self.logger.info(f"Processing {len(pending_pairs)} pairs with {max_workers} worker processes")
+            results = []
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(_process_pdf_pair, pair): pair[2] for pair in pending_pairs}
+                for future in as_completed(futures):
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        self.logger.error(f"Worker failed while processing {futures[future]}: {e}")
+                        results.append(False)
+        else:
+            results = [self.processor.process_pdf_pair(*pair) for pair in pending_pairs]
+        
+        successful_processing = sum(1 for success in results if success)
+        
         # Final summary
-        if not processed_files:
+        if not processed_prefixes:
             self.logger.error("No complete report pairs found!")
             self.logger.info("Ensure files are named: YYYYMMMonthlyBrokerageData.pdf and YYYYMMMetricsPressRelease.pdf")
         else:
-            self.logger.success(f"Processing complete: {successful_processing}/{len(processed_files)} successful")
+            self.logger.success(f"Processing complete: {successful_processing}/{len(processed_prefixes)} successful")
         
-        return len(processed_files), successful_processing
+        return len(processed_prefixes), successful_processing
 
 # ==============================================================================
 # 6. DEBUGGING AND DIAGNOSTIC TOOLS
 # ==============================================================================
 
+# Key indicators reported by analyze_pdf_structure, matched in a single pass over the page text
+_INDICATORS = ('Total Accounts', 'Client DARTs', 'Options Contracts', 'Jan', 'Feb', 'Mar', '2024', '2025')
+_INDICATOR_RE = re.compile('|'.join(map(re.escape, _INDICATORS)))
+
 class DebugTools:
     """Diagnostic and debugging utilities"""
     
     def __init__(self):
-        self.logger = Logger()
+        self.logger = _LOGGER
     
-    def analyze_pdf_structure(self, pdf_path):
+    @staticmethod
+    def _analyze_page(pdf_path, page_number):
+        """Extract dimensions, text, words and tables from one page (1-based)"""
+        # Each page gets its own handle, so the two analysis threads never share a pdfminer stream
+        with _pdfplumber().open(pdf_path, pages=[page_number]) as pdf:
+            page = pdf.pages[0]
+            try:
+                return page.width, page.height, page.extract_text(), page.extract_words(), page.extract_tables()
+            finally:
+                page.flush_cache()
+    
+    def analyze_pdf_structure(self, pdf_path, show_samples=True):
         """Analyze PDF structure for troubleshooting"""
         self.logger.info(f"🔍 ANALYZING PDF STRUCTURE: {Path(pdf_path).name}")
         self.logger.info("="*80)
         
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                self.logger.info(f"📖 Total pages: {len(pdf.pages)}")
-                
-                for page_num, page in enumerate(pdf.pages[:2]):  # First 2 pages only
-                    self.logger.info(f"\n--- Page {page_num + 1} ---")
-                    self.logger.info(f"Dimensions: {page.width:.1f} x {page.height:.1f}")
+            # PDFium reads the page count from the page tree without building any pages
+            with _PDFIUM_LOCK:
+                document = pdfium.PdfDocument(str(pdf_path))
+                try:
+                    page_count = len(document)
+                    self.logger.info(f"📖 Total pages: {page_count}")
+                finally:
+                    document.close()
+            
+            # Analyze the first 2 pages concurrently, each through its own pdfplumber handle,
+            # and report them in page order as results arrive
+            page_numbers = range(1, min(page_count, 2) + 1)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                analyses = executor.map(functools.partial(self._analyze_page, pdf_path), page_numbers)
+                for page_num, (width, height, text, words, tables) in zip(page_numbers, analyses):
+                    self.logger.info(f"\n--- Page {page_num} ---")
+                    self.logger.info(f"Dimensions: {width:.1f} x {height:.1f}")
                     
                     # Text extraction
-                    text = page.extract_text()
                     if text:
                         self.logger.info(f"Text characters: {len(text)}")
-                        self.logger.info("First 200 characters:")
-                        print(repr(text[:200]))
+                        if show_samples:
+                            self.logger.info("First 200 characters:")
+                            sys.stdout.write(f"{text[:200]!r}\n")
                         
                         # Look for key indicators
-                        indicators = ['Total Accounts', 'Client DARTs', 'Options Contracts', 
-                                    'Jan', 'Feb', 'Mar', '2024', '2025']
-                        found_indicators = [ind for ind in indicators if ind in text]
+                        found = set(_INDICATOR_RE.findall(text))
+                        found_indicators = [ind for ind in _INDICATORS if ind in found]
                         self.logger.info(f"Key indicators found: {found_indicators}")
                     else:
                         self.logger.warning("No text extracted")
                     
                     # Word extraction with positions
-                    words = page.extract_words()
                     self.logger.info(f"Words extracted: {len(words)}")
                     
-                    if words:
+                    if words and show_samples:
                         self.logger.info("Sample words with positions:")
-                        for i, word in enumerate(words[:8]):
-                            print(f"  '{word['text']}' at ({word['x0']:.1f}, {word['top']:.1f})")
+                        sys.stdout.write("".join(
+                            f"  '{word['text']}' at ({word['x0']:.1f}, {word['top']:.1f})\n" for word in words[:8]
+                        ))
                     
                     # Table extraction
-                    tables = page.extract_tables()
                     self.logger.info(f"Tables detected: {len(tables)}")
                     
                     if tables:
@@ -1076,7 +1347,7 @@ class DebugTools:
 
 def main():
     """Main application entry point"""
-    logger = Logger()
+    logger = _LOGGER
     
     # Parse command line arguments
     if len(sys.argv) > 1:
@@ -1090,7 +1361,7 @@ def main():
                 return
             
             debug_tools = DebugTools()
-            debug_tools.analyze_pdf_structure(pdf_path)
+            debug_tools.analyze_pdf_structure(pdf_path, show_samples="--no-samples" not in sys.argv[3:])
             
         elif command == "test" and len(sys.argv) > 4:
             # Test mode: test extraction on single PDF
@@ -1117,10 +1388,11 @@ NORMAL OPERATION:
     Expected file naming: YYYYMMMonthlyBrokerageData.pdf and YYYYMMMetricsPressRelease.pdf
 
 DEBUGGING MODES:
-    python ibkr_parser.py debug <pdf_path>
+    python ibkr_parser.py debug <pdf_path> [--no-samples]
     
     Analyzes PDF structure to help troubleshoot parsing issues.
     Shows text extraction, word positions, and table detection results.
+    --no-samples leaves out the raw text and word position samples.
     
     python ibkr_parser.py test <pdf_path> <year> <month>
     
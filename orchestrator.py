@@ -22,18 +22,27 @@ Usage:
 
 import os
 import sys
+import atexit
+import queue
+import fnmatch
 import argparse
 import subprocess
 import time
+import threading
+import importlib.util
 from pathlib import Path
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 
+# Default working directory, read once at import
+_CWD = Path.cwd()
+
 class IBKROrchestrator:
     """Main orchestrator class for IBKR data processing workflow"""
 
     def __init__(self, working_dir=None, verbose=False):
-        self.working_dir = Path(working_dir) if working_dir else Path.cwd()
+        self.working_dir = Path(working_dir) if working_dir else _CWD
         self.downloads_dir = self.working_dir / "downloads"
         self.output_dir = self.working_dir
         self.verbose = verbose
@@ -48,6 +57,11 @@ class IBKROrchestrator:
         """Setup logging configuration"""
         log_level = logging.DEBUG if self.verbose else logging.INFO
 
+        # The logger is process-wide; a second orchestrator must not stack another set of handlers
+        self.logger = logging.getLogger('IBKROrchestrator')
+        if self.logger.handlers:
+            return
+
         # Create logs directory
         logs_dir = self.working_dir / "logs"
         logs_dir.mkdir(exist_ok=True)
@@ -66,11 +80,15 @@ class IBKROrchestrator:
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
 
-        # Setup logger
-        self.logger = logging.getLogger('IBKROrchestrator')
+        # Setup logger; records are queued and written by a background listener thread,
+        # so streaming child output is never held up by file or console I/O
+        log_queue = queue.Queue(-1)
+        listener = QueueListener(log_queue, file_handler, console_handler)
+        listener.start()
+        atexit.register(listener.stop)  # Drains any queued records before exit
+
         self.logger.setLevel(log_level)
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        self.logger.addHandler(QueueHandler(log_queue))
 
         self.logger.info(f"Logging initialized. Log file: {log_file}")
 
@@ -80,17 +98,19 @@ class IBKROrchestrator:
 
         required_modules = [
             'pdfplumber',
+            'pypdfium2',
             'undetected_chromedriver',
             'selenium',
-            'pathlib'
+            'requests',
+            'selectolax'
         ]
 
         missing_modules = []
         for module in required_modules:
-            try:
-                __import__(module)
+            # Locate the module without importing it; selenium and friends are slow to initialise
+            if importlib.util.find_spec(module) is not None:
                 self.logger.debug(f"✓ {module} - OK")
-            except ImportError:
+            else:
                 missing_modules.append(module)
                 self.logger.error(f"✗ {module} - MISSING")
 
@@ -128,6 +148,48 @@ class IBKROrchestrator:
         self.logger.info("All required files present")
         return True
 
+    def run_script(self, script_path, timeout):
+        """Run a Python script and log its output as it streams"""
+        command = [sys.executable, "-u", str(script_path)]  # Unbuffered, so output arrives live
+        timed_out = threading.Event()
+        self.logger.info(f"{script_path.name} output:")
+
+        with subprocess.Popen(
+            command,
+            cwd=str(self.working_dir),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1
+        ) as process:
+            def kill_on_timeout():
+                timed_out.set()
+                process.kill()
+
+            def log_stderr():
+                for line in process.stderr:
+                    line = line.rstrip()
+                    if line:
+                        self.logger.warning(f"  {line}")
+
+            timer = threading.Timer(timeout, kill_on_timeout)
+            stderr_reader = threading.Thread(target=log_stderr, daemon=True)
+            timer.start()
+            stderr_reader.start()
+            try:
+                for line in process.stdout:
+                    line = line.rstrip()
+                    if line:
+                        self.logger.info(f"  {line}")
+                returncode = process.wait()
+                stderr_reader.join()
+            finally:
+                timer.cancel()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(command, timeout)
+        return returncode
+
     def download_pdfs(self):
         """Execute main.py to download PDFs from IBKR website"""
         self.logger.info("="*60)
@@ -143,32 +205,13 @@ class IBKROrchestrator:
 
             # Execute main.py
             self.logger.info("Executing main.py...")
-            result = subprocess.run(
-                [sys.executable, str(main_script)],
-                cwd=str(self.working_dir),
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
-            )
-
-            # Log output
-            if result.stdout:
-                self.logger.info("main.py output:")
-                for line in result.stdout.split('\n'):
-                    if line.strip():
-                        self.logger.info(f"  {line}")
-
-            if result.stderr:
-                self.logger.warning("main.py errors:")
-                for line in result.stderr.split('\n'):
-                    if line.strip():
-                        self.logger.warning(f"  {line}")
+            returncode = self.run_script(main_script, timeout=300)  # 5 minute timeout
 
-            if result.returncode == 0:
+            if returncode == 0:
                 self.logger.info("PDF download completed successfully")
                 return True
             else:
-                self.logger.error(f"PDF download failed with return code: {result.returncode}")
+                self.logger.error(f"PDF download failed with return code: {returncode}")
                 return False
 
         except subprocess.TimeoutExpired:
@@ -178,11 +221,21 @@ class IBKROrchestrator:
             self.logger.error(f"Error during PDF download: {e}")
             return False
 
+    @staticmethod
+    def scan_files(directory, pattern):
+        """List the files in a directory matching a glob pattern"""
+        try:
+            with os.scandir(directory) as entries:
+                return [entry for entry in entries
+                        if fnmatch.fnmatch(entry.name, pattern) and entry.is_file()]
+        except FileNotFoundError:
+            return []
+
     def check_downloaded_pdfs(self):
         """Check if PDFs were successfully downloaded"""
         self.logger.info("Checking for downloaded PDFs...")
 
-        pdf_files = list(self.downloads_dir.glob("*.pdf"))
+        pdf_files = self.scan_files(self.downloads_dir, "*.pdf")
 
         if not pdf_files:
             self.logger.warning("No PDF files found in downloads directory")
@@ -225,32 +278,13 @@ class IBKROrchestrator:
 
             # Execute map2.py
             self.logger.info("Executing map2.py...")
-            result = subprocess.run(
-                [sys.executable, str(map_script)],
-                cwd=str(self.working_dir),
-                capture_output=True,
-                text=True,
-                timeout=120  # 2 minute timeout
-            )
-
-            # Log output
-            if result.stdout:
-                self.logger.info("map2.py output:")
-                for line in result.stdout.split('\n'):
-                    if line.strip():
-                        self.logger.info(f"  {line}")
-
-            if result.stderr:
-                self.logger.warning("map2.py errors:")
-                for line in result.stderr.split('\n'):
-                    if line.strip():
-                        self.logger.warning(f"  {line}")
+            returncode = self.run_script(map_script, timeout=120)  # 2 minute timeout
 
-            if result.returncode == 0:
+            if returncode == 0:
                 self.logger.info("PDF processing completed successfully")
                 return True
             else:
-                self.logger.error(f"PDF processing failed with return code: {result.returncode}")
+                self.logger.error(f"PDF processing failed with return code: {returncode}")
                 return False
 
         except subprocess.TimeoutExpired:
@@ -265,7 +299,7 @@ class IBKROrchestrator:
         self.logger.info("Checking for output files...")
 
         # Look for IBKR_DATA_OUTPUT_*.csv files
-        output_files = list(self.working_dir.glob("IBKR_DATA_OUTPUT_*.csv"))
+        output_files = self.scan_files(self.working_dir, "IBKR_DATA_OUTPUT_*.csv")
 
         if not output_files:
             self.logger.warning("No output CSV files found")